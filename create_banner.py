@@ -5,10 +5,15 @@ circle mark (echoing the site navbar), Georgia serif (the site's Fraunces
 fallback), and a sparing red accent. White background, strong hierarchy.
 """
 
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.transforms import Bbox
 from pathlib import Path
 import base64
-from io import BytesIO
+import re
+from io import BytesIO, StringIO
+from functools import lru_cache
 
 # =============================================================================
 # Brand colors (aligned to the companion site / theme.scss)
@@ -21,16 +26,42 @@ WHITE   = '#FFFFFF'     # background
 
 FONT = 'Georgia'        # the site's serif fallback for the Fraunces wordmark
 
+# Smallest PNG Pillow can produce; the banner is embedded in every notebook
+PNG_OPTIONS = dict(pil_kwargs={'optimize': True}, metadata={'Software': None})
 
-def create_banner(
-    subtitle="Polynomial Regression",
-    author="Gregory Wheeler",
-    github_url="github.com/welr/learning_machines",
-    figsize=(10, 2.0),
-    dpi=150,
-):
-    """Create the notebook header banner, matched to the companion-site identity."""
-    fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+AUTHOR = "Gregory Wheeler"
+GITHUB_URL = "github.com/welr/learning_machines"
+
+BANNER_DIR = 'banners'  # static banner files, relative to the notebooks
+
+
+# =============================================================================
+# Cached banner figure
+# =============================================================================
+# Every banner shares the same canvas, wordmark, rule and brand marks; only the
+# topic and the metadata line change. The figure is built once (lazily) and the
+# two variable text artists are updated in place on each call.
+_FIG = None
+_FIG_KEY = None
+_TOPIC_ARTIST = None
+_META_ARTIST = None
+
+
+def _banner_figure(figsize, dpi):
+    """Build the static banner skeleton, or return the cached one."""
+    global _FIG, _FIG_KEY, _TOPIC_ARTIST, _META_ARTIST
+    key = (tuple(figsize), dpi)
+    if _FIG is not None and _FIG_KEY == key:
+        return _FIG
+
+    # Built directly on an Agg canvas, bypassing pyplot's figure manager: the
+    # figure is never shown and is garbage-collected like any other object.
+    # Every position below is hardcoded in data coordinates, so no layout
+    # engine is needed: the axes simply fill the figure.
+    fig = Figure(figsize=figsize, dpi=dpi, layout=None)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
     fig.patch.set_facecolor(WHITE)
     ax.set_facecolor(WHITE)
     ax.set_xlim(0, 10)
@@ -57,41 +88,100 @@ def create_banner(
 
     # Notebook topic: a small red dot + blue label (replaces the old green ►)
     ax.scatter([left + 0.07], [0.5], s=70, color=RED, zorder=3, edgecolors='none')
-    ax.text(left + 0.30, 0.5, subtitle,
-            fontsize=16, color=FS_BLUE,
-            verticalalignment='center', fontfamily=FONT)
+    topic_artist = ax.text(left + 0.30, 0.5, "",
+                           fontsize=16, color=FS_BLUE,
+                           verticalalignment='center', fontfamily=FONT)
 
     # Metadata (bottom right)
+    meta_artist = ax.text(9.7, 0.18, "",
+                          fontsize=11, color=GRAY,
+                          verticalalignment='center', horizontalalignment='right',
+                          fontfamily=FONT)
+
+    _FIG, _FIG_KEY = fig, key
+    _TOPIC_ARTIST, _META_ARTIST = topic_artist, meta_artist
+    return fig
+
+
+def _banner_bbox(fig):
+    """
+    Bounding box (in inches) for saving the banner.
+
+    The axes fill the figure, so the figure itself is the banner's extent.
+    Passing it explicitly spares savefig the extra draw pass that
+    bbox_inches='tight' costs on every call.
+    """
+    return Bbox.from_bounds(0, 0, *fig.get_size_inches())
+
+
+def create_banner(
+    subtitle="Polynomial Regression",
+    author=AUTHOR,
+    github_url=GITHUB_URL,
+    figsize=(10, 2.0),
+    dpi=96,
+):
+    """
+    Create the notebook header banner, matched to the companion-site identity.
+
+    The returned figure is shared between calls: save it before requesting
+    the next banner.
+    """
+    fig = _banner_figure(figsize, dpi)
+
     meta_text = f"{author}"
     if github_url:
         display_url = github_url.replace("https://", "").replace("http://", "")
         meta_text += f" · {display_url}"
-    ax.text(9.7, 0.18, meta_text,
-            fontsize=11, color=GRAY,
-            verticalalignment='center', horizontalalignment='right',
-            fontfamily=FONT)
 
-    plt.tight_layout(pad=0)
+    _TOPIC_ARTIST.set_text(subtitle)
+    _META_ARTIST.set_text(meta_text)
     return fig
 
 
-def banner_to_base64(fig, format='png', dpi=150):
+def banner_to_base64(fig, format='png', dpi=96):
     """Convert matplotlib figure to base64 string for embedding."""
     buffer = BytesIO()
-    fig.savefig(buffer, format=format, dpi=dpi, bbox_inches='tight',
-                pad_inches=0, facecolor=WHITE, edgecolor='none')
-    buffer.seek(0)
-    img_str = base64.b64encode(buffer.read()).decode('utf-8')
-    plt.close(fig)
+    options = PNG_OPTIONS if format == 'png' else {}
+    fig.savefig(buffer, format=format, dpi=dpi, bbox_inches=_banner_bbox(fig),
+                pad_inches=0, facecolor=WHITE, edgecolor='none', **options)
+    img_str = base64.b64encode(buffer.getvalue()).decode('ascii')
+    # The figure is cached and reused by create_banner, so it is not closed here
     return img_str
 
 
-def generate_markdown_header(subtitle):
-    """Generate the markdown cell content with the embedded banner."""
-    fig = create_banner(subtitle=subtitle)
-    b64 = banner_to_base64(fig)
+def banner_slug(subtitle):
+    """File-name slug for a subtitle: 'Linear Regression: OLS' -> 'linear_regression_ols'."""
+    return re.sub(r'[^a-z0-9]+', '_', subtitle.lower()).strip('_')
+
+
+def save_banner(subtitle, filepath, author=AUTHOR, github_url=GITHUB_URL, dpi=150):
+    """Render the banner to a PNG file, for notebooks that link rather than embed it."""
+    fig = create_banner(subtitle=subtitle, author=author, github_url=github_url)
+    fig.savefig(filepath, dpi=dpi, bbox_inches=_banner_bbox(fig), pad_inches=0,
+                facecolor=WHITE, edgecolor='none', **PNG_OPTIONS)
+    return filepath
+
+
+@lru_cache(maxsize=64)
+def generate_markdown_header(subtitle, author=AUTHOR, github_url=GITHUB_URL, dpi=96,
+                             embed=True):
+    """
+    Generate the markdown cell content for the banner.
+
+    With embed=True the PNG is inlined as base64; 96 dpi is plenty for an
+    image displayed at max-width 900px. With embed=False the cell links to
+    BANNER_DIR/<slug>.png instead, which save_banner must write. The result is
+    a pure function of the arguments, so repeated subtitles are rendered once.
+    """
+    if embed:
+        fig = create_banner(subtitle=subtitle, author=author, github_url=github_url,
+                            dpi=dpi)
+        src = f"data:image/png;base64,{banner_to_base64(fig, dpi=dpi)}"
+    else:
+        src = f"{BANNER_DIR}/{banner_slug(subtitle)}.png"
     markdown = f'''<div style="margin-bottom: 32px;">
-<img src="data:image/png;base64,{b64}"
+<img src="{src}"
      alt="Learning Machines: {subtitle}"
      style="width: 100%; max-width: 900px; border-radius: 2px;">
 </div>
@@ -99,14 +189,49 @@ def generate_markdown_header(subtitle):
     return markdown
 
 
+def banner_to_svg(fig):
+    """
+    Convert matplotlib figure to an inline <svg> element for embedding.
+
+    The banner is pure vector content, so this skips rasterization and base64
+    encoding. Glyphs are emitted as paths (the default svg.fonttype), and the
+    id salt and metadata are pinned so the output is reproducible.
+    """
+    buffer = StringIO()
+    with matplotlib.rc_context({'svg.hashsalt': 'learning-machines'}):
+        fig.savefig(buffer, format='svg', bbox_inches=_banner_bbox(fig),
+                    pad_inches=0, facecolor=WHITE, edgecolor='none',
+                    metadata={'Date': None, 'Creator': None})
+    svg = buffer.getvalue()
+    # Drop the XML prolog/doctype and let the element scale with its container
+    svg = svg[svg.index('<svg'):]
+    svg = re.sub(r'width="[^"]*" height="[^"]*"', 'width="100%"', svg, count=1)
+    return svg.strip()
+
+
+@lru_cache(maxsize=64)
+def generate_markdown_header_svg(subtitle, author=AUTHOR, github_url=GITHUB_URL):
+    """
+    Generate the markdown cell content with the banner as inline SVG.
+
+    Some renderers (e.g. GitHub's notebook viewer) strip inline SVG from
+    markdown; use generate_markdown_header there.
+    """
+    fig = create_banner(subtitle=subtitle, author=author, github_url=github_url)
+    svg = banner_to_svg(fig)
+    markdown = f'''<div style="margin-bottom: 32px; max-width: 900px;"
+     role="img" aria-label="Learning Machines: {subtitle}">
+{svg}
+</div>
+'''
+    return markdown
+
+
 if __name__ == "__main__":
     output_dir = Path("banner_output")
     output_dir.mkdir(exist_ok=True)
+    # save_banner reuses the cached figure: only the topic text changes
     for topic in ["Polynomial Regression", "Gradient Descent", "Capstone: Build a GPT"]:
-        fig = create_banner(subtitle=topic)
-        filepath = output_dir / (topic.lower().replace(" ", "_").replace(":", "") + "_banner.png")
-        fig.savefig(filepath, dpi=150, bbox_inches='tight', pad_inches=0,
-                    facecolor=WHITE, edgecolor='none')
-        plt.close(fig)
+        filepath = save_banner(topic, output_dir / f"{banner_slug(topic)}_banner.png")
         print(f"- Created: {filepath}")
     print(f"\nDone. Samples in ./{output_dir.name}/")
@@ -1,12 +1,38 @@
 """
 Insert banners into all Learning Machines notebooks.
-Generates base64-encoded images and inserts them as the first markdown cell.
+Renders each banner to banners/<slug>.png and inserts a markdown cell linking
+to it as the first cell (--embed inlines a base64 PNG instead, --svg inline SVG).
 """
 
+import argparse
+import hashlib
 import json
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import create_banner
 
+try:
+    import orjson  # optional: much faster parsing of large notebooks
+except ImportError:
+    orjson = None
+
+# Generated banner markdown, keyed by banner inputs; see banner_cache_key
+CACHE_PATH = Path(__file__).parent / '.banner_cache.json'
+
+# Rendered banner files, linked from the notebooks by relative path
+BANNERS_DIR = Path(__file__).parent / create_banner.BANNER_DIR
+
+# Start of a notebook as written with indent=1, up to the first cell's "{"
+CELLS_OPENER = re.compile(r'\{\n "cells": \[\n  (?=\{)')
+
+# Banner variants: linked PNG file (default), embedded base64 PNG, inline SVG
+BANNER_MODES = ('file', 'embed', 'svg')
+
+# Markup only the banner generator emits, identifying an existing banner cell:
+# the <img> alt text (linked or embedded PNG) and the SVG wrapper's label
+BANNER_MARKERS = ('alt="Learning Machines:', 'aria-label="Learning Machines:')
+
 # Notebook -> Banner subtitle mapping
 NOTEBOOKS = {
     "ch02_01_polynomial_regression.ipynb": "Polynomial Regression",
@@ -34,13 +60,102 @@ NOTEBOOKS = {
     "ch08_02_kernel_methods.ipynb": "Kernel Methods",
 }
 
-def insert_banner(notebook_path, subtitle):
-    """Insert banner as first cell in notebook."""
+def banner_cache_key(subtitle, mode='file'):
+    """Hash everything that determines a banner, including the generator source."""
+    source_mtime = Path(create_banner.__file__).stat().st_mtime
+    inputs = (subtitle, create_banner.AUTHOR, create_banner.GITHUB_URL, mode,
+              source_mtime)
+    return hashlib.sha256(json.dumps(inputs).encode('utf-8')).hexdigest()
+
+
+def load_banner_cache():
+    """Load the on-disk banner cache (empty if missing or unreadable)."""
+    try:
+        with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_banner_cache(cache):
+    """
+    Write the banner cache, keeping only entries for the current notebooks.
+
+    Entries for every mode are kept, so switching between the default,
+    --embed and --svg does not re-render banners already cached.
+    """
+    current = {banner_cache_key(subtitle, mode)
+               for subtitle in NOTEBOOKS.values() for mode in BANNER_MODES}
+    cache = {key: md for key, md in cache.items() if key in current}
+    with open(CACHE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=1)
+
+
+def banner_markdown(subtitle, cache, mode='file'):
+    """
+    Return the banner markdown for a subtitle, generating it only on a cache miss.
+
+    mode is 'file' (write BANNERS_DIR/<slug>.png and link to it), 'embed'
+    (inline base64 PNG) or 'svg' (inline SVG).
+    """
+    key = banner_cache_key(subtitle, mode)
+    if mode == 'file':
+        banner_path = BANNERS_DIR / f"{create_banner.banner_slug(subtitle)}.png"
+        if key not in cache or not banner_path.exists():
+            BANNERS_DIR.mkdir(exist_ok=True)
+            create_banner.save_banner(subtitle, banner_path)
+            cache[key] = create_banner.generate_markdown_header(subtitle, embed=False)
+    elif key not in cache:
+        if mode == 'svg':
+            cache[key] = create_banner.generate_markdown_header_svg(subtitle)
+        else:
+            cache[key] = create_banner.generate_markdown_header(subtitle)
+    return cache[key]
+
+
+def parse_notebook(text):
+    """Parse notebook JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def first_cell_span(text):
+    """
+    Locate the first cell of a notebook without parsing the rest of it.
+
+    Returns (start, end, cell) where text[start:end] is the first cell's JSON,
+    or None if the text is not laid out the way Jupyter (and this script)
+    write notebooks: indent=1 with "cells" as the first key.
+    """
+    match = CELLS_OPENER.match(text)
+    if match is None:
+        return None
+    try:
+        cell, end = json.JSONDecoder().raw_decode(text, match.end())
+    except ValueError:
+        return None
+    return match.end(), end, cell
+
+
+def insert_banner(notebook_path, subtitle, cache=None, mode='file'):
+    """Insert banner as first cell in notebook. Returns a status line."""
     with open(notebook_path, 'r', encoding='utf-8') as f:
-        nb = json.load(f)
+        text = f.read()
+
+    # Only the first cell changes, so only the first cell is parsed; the full
+    # parse is the fallback for notebooks in an unexpected layout
+    span = first_cell_span(text)
+    if span is not None:
+        start, end, first_cell = span
+    else:
+        nb = parse_notebook(text)
+        first_cell = nb['cells'][0] if nb['cells'] else {}
 
-    # Generate the banner markdown
-    banner_md = create_banner.generate_markdown_header(subtitle)
+    # Generate the banner markdown (or reuse it from the cache)
+    if cache is None:
+        cache = {}
+    banner_md = banner_markdown(subtitle, cache, mode)
 
     # Create the banner cell
     banner_cell = {
@@ -49,32 +164,89 @@ def insert_banner(notebook_path, subtitle):
         "source": [banner_md]
     }
 
-    # Check if first cell is already a banner (contains our base64 image)
-    if nb['cells'] and 'data:image/png;base64' in ''.join(nb['cells'][0].get('source', [])):
-        # Replace existing banner
-        nb['cells'][0] = banner_cell
-        print(f"  Updated existing banner: {notebook_path.name}")
+    # Check if first cell is already a banner (contains our image). The source
+    # lines are scanned one by one so a large first cell is never joined just
+    # to look for the marker.
+    source = first_cell.get('source', [])
+    if isinstance(source, str):
+        source = [source]
+    replace = (first_cell.get('cell_type') == 'markdown'
+               and any(marker in line for line in source for marker in BANNER_MARKERS))
+    if replace and ''.join(source) == banner_md:
+        # Banner is already current: leave the file (and its mtime) untouched
+        return f"  Banner up to date: {notebook_path.name}"
+    if replace:
+        status = f"  Updated existing banner: {notebook_path.name}"
+    else:
+        status = f"  Inserted new banner: {notebook_path.name}"
+
+    if span is not None:
+        # Splice the new cell into the original text, re-indented to sit at
+        # cell depth; every other cell is copied through verbatim
+        cell_json = json.dumps(banner_cell, indent=1, ensure_ascii=False)
+        cell_json = cell_json.replace('\n', '\n  ')
+        if replace:
+            output = text[:start] + cell_json + text[end:]
+        else:
+            output = text[:start] + cell_json + ',\n  ' + text[start:]
     else:
-        # Insert new banner at top
-        nb['cells'].insert(0, banner_cell)
-        print(f"  Inserted new banner: {notebook_path.name}")
+        if replace:
+            nb['cells'][0] = banner_cell
+        else:
+            nb['cells'].insert(0, banner_cell)
+        # Serialize in memory, then hand the file a single write. The stdlib
+        # encoder is kept because orjson only supports 2-space indentation and
+        # notebooks are stored with indent=1.
+        output = json.dumps(nb, indent=1, ensure_ascii=False)
 
-    # Write back
     with open(notebook_path, 'w', encoding='utf-8') as f:
-        json.dump(nb, f, indent=1, ensure_ascii=False)
+        f.write(output)
+    return status
+
+
+def _insert_banner_job(job):
+    """Worker entry point: run insert_banner and hand back the cache entries."""
+    notebook_path, subtitle, cache, mode = job
+    status = insert_banner(notebook_path, subtitle, cache, mode)
+    return status, cache
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    variant = parser.add_mutually_exclusive_group()
+    variant.add_argument('--embed', action='store_const', dest='mode', const='embed',
+                         help='embed banners as base64 PNG instead of linking files')
+    variant.add_argument('--svg', action='store_const', dest='mode', const='svg',
+                         help='embed banners as inline SVG instead of linking files')
+    parser.set_defaults(mode='file')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='worker processes (default: one per CPU)')
+    args = parser.parse_args(argv)
 
-def main():
     notebooks_dir = Path(__file__).parent
 
     print("Inserting banners into notebooks...\n")
 
+    cache = load_banner_cache()
+    jobs = []
     for filename, subtitle in NOTEBOOKS.items():
         notebook_path = notebooks_dir / filename
         if notebook_path.exists():
-            insert_banner(notebook_path, subtitle)
+            # Each worker only needs (and can only return) its own cache entry
+            key = banner_cache_key(subtitle, args.mode)
+            entry = {key: cache[key]} if key in cache else {}
+            jobs.append((notebook_path, subtitle, entry, args.mode))
         else:
             print(f"  NOT FOUND: {filename}")
 
+    # Notebooks are independent files, so they are processed in parallel.
+    # Processes rather than threads: Matplotlib is not thread-safe.
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        for status, entry in pool.map(_insert_banner_job, jobs):
+            print(status)
+            cache.update(entry)
+    save_banner_cache(cache)
+
     print("\nDone!")
 
 if __name__ == "__main__":
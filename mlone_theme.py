@@ -28,7 +28,9 @@ Usage:
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
-import numpy as np
+from matplotlib.font_manager import FontProperties
+from matplotlib.ticker import FormatStrFormatter
+from functools import lru_cache
 from pathlib import Path
 
 # =============================================================================
@@ -83,6 +85,10 @@ NOTEBOOK_COLORS = [GREEN, SEAFOAM, BLUE, CYAN, RED, ORANGE, GRAY]
 NOTEBOOK_COLORS_2 = [GREEN, SEAFOAM]
 NOTEBOOK_COLORS_3 = [GREEN, SEAFOAM, RED]
 
+# Property cycles for the mode switchers, built once
+_BOOK_CYCLER = plt.cycler('color', BOOK_COLORS)
+_NOTEBOOK_CYCLER = plt.cycler('color', NOTEBOOK_COLORS)
+
 # Active colors (default to book mode)
 COLORS = BOOK_COLORS
 COLORS_2 = BOOK_COLORS_2
@@ -107,7 +113,7 @@ def set_notebook_mode():
     COLORS = NOTEBOOK_COLORS
     COLORS_2 = NOTEBOOK_COLORS_2
     COLORS_3 = NOTEBOOK_COLORS_3
-    plt.rcParams['axes.prop_cycle'] = plt.cycler('color', NOTEBOOK_COLORS)
+    plt.rcParams['axes.prop_cycle'] = _NOTEBOOK_CYCLER
 
 
 def set_book_mode():
@@ -125,13 +131,24 @@ def set_book_mode():
     COLORS = BOOK_COLORS
     COLORS_2 = BOOK_COLORS_2
     COLORS_3 = BOOK_COLORS_3
-    plt.rcParams['axes.prop_cycle'] = plt.cycler('color', BOOK_COLORS)
+    plt.rcParams['axes.prop_cycle'] = _BOOK_CYCLER
 
 
 # =============================================================================
 # STYLE APPLICATION
 # =============================================================================
 
+@lru_cache(maxsize=None)
+def _font_properties(family, size, weight='normal'):
+    """
+    Shared FontProperties for title/subtitle text.
+
+    Keyed on the font family (a tuple) so that a style sheet applied after
+    import is still honored; Text artists copy the properties they are given.
+    """
+    return FontProperties(family=list(family), size=size, weight=weight)
+
+
 def apply_book_style(ax, title=None, subtitle=None, y_label_right=True):
     """
     Apply editorial-style formatting to an axes object.
@@ -173,10 +190,13 @@ def apply_book_style(ax, title=None, subtitle=None, y_label_right=True):
     ax.tick_params(axis='x', bottom=True, top=False, direction='out', length=4)
 
     # Title and subtitle
+    family = tuple(plt.rcParams['font.family'])
     if title:
-        ax.set_title(title, fontweight='bold', fontsize=18, loc='left', pad=12)
+        ax.set_title(title, fontproperties=_font_properties(family, 18, 'bold'),
+                     loc='left', pad=12)
     if subtitle:
-        ax.text(0, 1.02, subtitle, transform=ax.transAxes, fontsize=14,
+        ax.text(0, 1.02, subtitle, transform=ax.transAxes,
+                fontproperties=_font_properties(family, 14),
                 color=GRAY, va='bottom', ha='left')
 
 
@@ -272,18 +292,17 @@ def add_line_labels(ax, lines, labels, colors=None, position='end'):
         Where to place labels: 'end', 'start', or 'middle'
     """
     for i, (line, label) in enumerate(zip(lines, labels)):
-        xdata, ydata = line.get_xdata(), line.get_ydata()
+        xy = line.get_xydata()  # one (N, 2) array instead of two lookups
         color = colors[i] if colors else line.get_color()
 
         if position == 'end':
-            x, y = xdata[-1], ydata[-1]
+            x, y = xy[-1]
             ha, offset = 'left', (8, 0)
         elif position == 'start':
-            x, y = xdata[0], ydata[0]
+            x, y = xy[0]
             ha, offset = 'right', (-8, 0)
         else:  # middle
-            mid = len(xdata) // 2
-            x, y = xdata[mid], ydata[mid]
+            x, y = xy[len(xy) // 2]
             ha, offset = 'center', (0, 10)
 
         add_direct_label(ax, x, y, label, color, ha=ha, offset=offset)
@@ -510,7 +529,6 @@ def set_axis_format(ax, x_format=None, y_format=None):
     y_format : str, optional
         Format string for y-axis
     """
-    from matplotlib.ticker import FormatStrFormatter
     if x_format:
         ax.xaxis.set_major_formatter(FormatStrFormatter(x_format))
     if y_format: